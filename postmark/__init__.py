@@ -34,7 +34,7 @@ __doc__ = '''
         add the setting
 
         POSTMARK_API_KEY = 'your-key'
-        POSTMARK_SENDER = '<From Name> from@emailaddress.com'
+        POSTMARK_SENDER = 'From Name <from@emailaddress.com>'
         POSTMARK_TEST_MODE = True/False
 
         to your settings.py file, and when you create a new PMMail object,
@@ -57,6 +57,10 @@ __doc__ = '''
         PMMailMissingValueException(Exception):
             One of the required values for attempting a send request is missing
 
+        PMMailInvalidValueException(PMMailMissingValueException):
+            One of the values for attempting a send request is malformed,
+            such as an invalid e-mail address
+
         PMMailSendException(Exception):
             Base Postmark send exception
 
@@ -75,7 +79,8 @@ __doc__ = '''
         PMMailURLException(PMMailSendException):
             A URLError was caught - usually has to do with connectivity
             and the ability to reach the server.  The inner_exception will
-            have the base URLError object.
+            have a URLError object whose .reason is the requests (or httpx)
+            exception.
 
         PMMailInactiveRecipientException(PMMailSendException):
             406: You tried to send a message to a recipient that has been marked as
@@ -0,0 +1,124 @@
+#
+# Asynchronous sending, for use from asyncio code. Requires httpx:
+#
+#     pip install httpx[http2]
+import asyncio
+import importlib.util
+
+import httpx
+
+from postmark.core import (
+    PMMail, PMBatchMail,
+    _TIMEOUT, _chunks, _return_json_setting, _test_setting, _url_exception
+)
+
+
+# One client per event loop: pooled connections belong to the loop that
+# opened them, and frameworks such as Django's async_to_sync may run each
+# call on a new loop. Sends on the same loop are multiplexed over the same
+# connections. HTTP/2 is only used when the optional h2 package is installed.
+_CLIENTS = {}
+
+
+def _new_client():
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec('h2') is not None,
+        limits=httpx.Limits(max_connections=100),
+        timeout=_TIMEOUT,
+    )
+
+
+def _client():
+    '''
+    Return the client for the running event loop, creating it if needed.
+    '''
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        # Clients of loops that have since closed can no longer be used.
+        # Loops may run in other threads, so iterate over a snapshot and
+        # tolerate another thread dropping the same entry.
+        for other in list(_CLIENTS):
+            if other.is_closed():
+                _CLIENTS.pop(other, None)
+        client = _CLIENTS[loop] = _new_client()
+    return client
+
+
+async def aclose():
+    '''
+    Close the client of the running event loop. Call this before the
+    loop is closed; a new client is created by the next send.
+    '''
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class AsyncPMMail(PMMail):
+    '''
+    A PMMail whose send() is a coroutine.
+    '''
+
+    __slots__ = ()
+
+    async def send(self, test=None, return_json=None, client=None):
+        '''
+        Send the email through the Postmark system.
+        Pass test=True to just print out the resulting
+        JSON message being sent to Postmark. Pass an httpx.AsyncClient
+        as client to send through it instead of the running event
+        loop's shared client.
+        '''
+        request = self._prepare_send(test)
+        if request is None:
+            return
+
+        endpoint_url, payload = request
+        return_json = _return_json_setting(return_json)
+
+        # Attempt send
+        try:
+            result = await (client or _client()).post(endpoint_url, content=payload, headers=self._get_headers())
+        except httpx.HTTPError as err:
+            raise _url_exception(err)
+
+        return self._handle_response(result, result.reason_phrase, return_json)
+
+
+class AsyncPMBatchMail(PMBatchMail):
+    '''
+    A PMBatchMail whose send() is a coroutine. All chunks are sent
+    concurrently.
+    '''
+
+    __slots__ = ()
+
+    async def send(self, test=None, return_json=None, client=None):
+        # Check messages for completeness prior to attempting to send
+        self._check_values()
+
+        test = _test_setting(test)
+        return_json = _return_json_setting(return_json)
+
+        # Split up into groups of 500 messages for sending
+        chunks = list(_chunks(self.messages, PMBatchMail.MAX_MESSAGES))
+
+        # If this is a test, just print the messages
+        if test:
+            self._print_chunks(chunks)
+            return True
+
+        chunk_results = await asyncio.gather(*[self._send_chunk(messages, client) for messages in chunks])
+        return self._collect_results(chunk_results, return_json)
+
+    async def _send_chunk(self, messages, client=None):
+        endpoint_url, payload = self._prepare_chunk(messages)
+
+        # Attempt send
+        try:
+            result = await (client or _client()).post(endpoint_url, content=payload, headers=self._get_headers())
+        except httpx.HTTPError as err:
+            raise _url_exception(err)
+
+        return self._handle_chunk_response(messages, result, result.reason_phrase)
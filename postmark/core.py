@@ -1,6 +1,10 @@
 #
 # Imports (JSON library based on import try)
+import re
 import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import getaddresses
 
 from postmark import __version__
 
@@ -10,16 +14,16 @@ except ImportError as e:
     from email import MIMEBase
 
 if sys.version_info[0] < 3:
-    from urllib2 import Request, urlopen, HTTPError, URLError
-    from httplib import HTTPConnection
+    from urllib2 import HTTPError, URLError
     from urllib import urlencode
 else:
-    from urllib.request import Request, urlopen
     from urllib.error import HTTPError, URLError
-    from http.client import HTTPConnection
     from urllib.parse import urlencode
 
-from contextlib import closing
+from io import BytesIO
+
+import requests
+from requests.adapters import HTTPAdapter
 
 try:
     import simplejson as json
@@ -30,6 +34,25 @@ except ImportError:
     except ImportError:
         import json
 
+# Django settings are only read when Django is installed and configured
+try:
+    from django.core.exceptions import ImproperlyConfigured as _ImproperlyConfigured
+except ImportError:
+    class _ImproperlyConfigured(Exception):
+        pass
+
+# pybase64 is optional, but much faster at encoding large attachments
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+# orjson is optional, but much faster at building request payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 #
 #
@@ -38,10 +61,107 @@ class PMJSONEncoder(json.JSONEncoder):
         if hasattr(o, '_proxy____unicode_cast'):
             return unicode(o)
         return super(PMJSONEncoder, self).default(o)
+
+
+def _orjson_default(o):
+    if hasattr(o, '_proxy____unicode_cast'):
+        return str(o)
+    raise TypeError('Type is not JSON serializable: %s' % type(o).__name__)
+
+
+def _json_dumps(obj):
+    '''
+    Serialize obj to UTF-8 encoded JSON bytes
+    '''
+    if orjson is not None:
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, cls=PMJSONEncoder).encode('utf8')
+
+
+# Minimum size of the fields shared by a batch before they are spliced
+_SPLICE_MIN_BYTES = 1024
+
+# Types whose equal values always serialize to the same JSON
+_PLAIN_JSON_TYPES = (str, int, bool, type(None))
+
+
+def _same_json(value, other, value_json):
+    '''
+    Whether other serializes to value_json, the JSON bytes of value.
+    Equal values can serialize differently (1, True and 1.0, or nested
+    ones), so only _PLAIN_JSON_TYPES skip the byte comparison.
+    '''
+    if other is value:
+        return True
+    if type(other) is not type(value) or other != value:
+        return False
+    return type(value) in _PLAIN_JSON_TYPES or _json_dumps(other) == value_json
+
+
+def _json_dumps_messages(json_messages):
+    '''
+    Serialize a list of message dictionaries to JSON bytes. With the
+    standard library encoder, large fields that serialize the same in
+    every message (sender, body, template model, ...) are encoded once
+    and spliced into each message. orjson dumps the whole list faster.
+    '''
+    if orjson is not None or len(json_messages) < 2:
+        return _json_dumps(json_messages)
+    if len(_json_dumps(json_messages[0])) < _SPLICE_MIN_BYTES:
+        # Shared fields are a subset of the first message, so too small
+        return _json_dumps(json_messages)
+
+    others = json_messages[1:]
+    shared = {}
+    for key, value in json_messages[0].items():
+        value_json = None if type(value) in _PLAIN_JSON_TYPES else _json_dumps(value)
+        if all(key in m and _same_json(value, m[key], value_json) for m in others):
+            shared[key] = value
+
+    # Opening brace and shared fields, without the closing brace
+    prefix = _json_dumps(shared)[:-1] if shared else b''
+    if len(prefix) < _SPLICE_MIN_BYTES:
+        # Too little is shared for splicing to beat a single dump
+        return _json_dumps(json_messages)
+
+    parts = [b'[']
+    for message in json_messages:
+        rest = dict((k, v) for k, v in message.items() if k not in shared)
+        parts.append(prefix)
+        parts.append(b', ' + _json_dumps(rest)[1:] if rest else b'}')
+        parts.append(b', ')
+    parts[-1] = b']'
+    # A single join so the shared bytes are only copied into the result
+    return b''.join(parts)
+
+
+def _json_loads(data):
+    '''
+    Parse UTF-8 encoded JSON bytes
+    '''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf8'))
 #
 #
 __POSTMARK_URL__ = 'https://api.postmarkapp.com/'
 
+# Domain labels cannot contain dots, so no two parts of the pattern can
+# match the same character and matching never backtracks.
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+$')
+
+_USER_AGENT = 'Python/%s (python-postmark library version %s)' % ('_'.join([str(var) for var in sys.version_info]), __version__)
+
+# Seconds to wait for Postmark to answer a send request
+_TIMEOUT = 30
+
+# Shared HTTP session so keep-alive connections (and their TLS sessions)
+# are reused across sends instead of reconnecting for every message.
+# The session also asks for gzip-compressed responses and decompresses
+# them transparently, so request headers must not set Accept-Encoding.
+_SESSION = requests.Session()
+_SESSION.mount(__POSTMARK_URL__, HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
 
 #
 #
@@ -50,6 +170,15 @@ class PMMail(object):
     The Postmark Mail object.
     '''
 
+    # No per-instance __dict__; keeps large send_messages() batches small
+    __slots__ = (
+        '__headers', '__api_key', '__sender', '__reply_to',
+        '__to', '__cc', '__bcc', '__subject', '__tag', '__html_body',
+        '__text_body', '__track_opens', '__custom_headers', '__attachments',
+        '__message_id', '__metadata', '__template_id', '__template_alias',
+        '__template_model', '__message_stream', '__user_agent'
+    )
+
     def __init__(self, **kwargs):
         '''
         Keyword arguments are:
@@ -79,6 +208,7 @@ class PMMail(object):
         message_stream: Message stream ID that's used for sending. If not provided, message will default to the "outbound" transactional stream.
         '''
         # initialize properties
+        self.__headers = None
         self.__api_key = None
         self.__sender = None
         self.__reply_to = None
@@ -130,7 +260,7 @@ class PMMail(object):
                     setattr(self, key, kwargs[key])
 
         # Set up the user-agent
-        self.__user_agent = 'Python/%s (python-postmark library version %s)' % ('_'.join([str(var) for var in sys.version_info]), __version__)
+        self.__user_agent = _USER_AGENT
 
         # Try to pull in the API key from Django
         try:
@@ -143,7 +273,7 @@ class PMMail(object):
                 self.__sender = django_settings.POSTMARK_SENDER
             if not self.__track_opens and hasattr(django_settings, 'POSTMARK_TRACK_OPENS'):
                 self.__track_opens = django_settings.POSTMARK_TRACK_OPENS
-        except ImportError:
+        except (ImportError, _ImproperlyConfigured):
             pass
 
     @property
@@ -331,7 +461,7 @@ class PMMail(object):
     metadata = property(
         lambda self: self.__metadata,
         _set_metadata,
-        lambda self: setattr(self, '_PMMail_metadata', {}),
+        lambda self: setattr(self, '_PMMail__metadata', {}),
         '''
         Custom metadata key/value pairs returned by webhooks.
         '''
@@ -415,9 +545,19 @@ class PMMail(object):
             raise PMMailMissingValueException('Cannot send an e-mail without a subject')
         elif not self.__html_body and not self.__text_body and not (self.__template_id or self.__template_alias):
             raise PMMailMissingValueException('Cannot send an e-mail without either an HTML or text version of your e-mail body')
+
+        for field, value in (('sender', self.__sender), ('reply_to', self.__reply_to),
+                             ('to', self.__to), ('cc', self.__cc), ('bcc', self.__bcc)):
+            if value:
+                _check_addresses(field, value)
+
         if self.__track_opens and not self.__html_body:
             print('WARNING: .track_opens set to True with no .html_body set. Tracking opens will not work; message will still send.')
 
+    def _get_headers(self):
+        self.__headers = _headers(self.__headers, self.__api_key, self.__user_agent)
+        return self.__headers
+
     def to_json_message(self):
         json_message = {
             'From': self.__sender,
@@ -470,33 +610,9 @@ class PMMail(object):
         if len(self.__attachments) > 0:
             attachments = []
             for attachment in self.__attachments:
-                if isinstance(attachment, tuple):
-                    file_item = {
-                        "Name": attachment[0],
-                        "Content": attachment[1],
-                        "ContentType": attachment[2],
-                    }
-                    # If need add Content-ID header:
-                    if len(attachment) >= 4 and attachment[3]:
-                        file_item["ContentID"] = attachment[3]
-                elif isinstance(attachment, MIMEBase):
-                    file_item = {
-                        "Name": attachment.get_filename(),
-                        "Content": attachment.get_payload(),
-                        "ContentType": attachment.get_content_type(),
-                    }
-                    content_id = attachment.get("Content-ID")
-                    if content_id:
-                        # Because postmarkapp api required clear value. Not enclosed in angle brackets:
-                        if content_id.startswith("<") and content_id.endswith(">"):
-                            content_id = content_id[1:-1]
-                        # Postmarkapp will mark attachment as "inline" only if "ContentID" field starts with "cid":
-                        if (attachment.get("Content-Disposition") or "").startswith("inline"):
-                            content_id = "cid:%s" % content_id
-                        file_item["ContentID"] = content_id
-                else:
-                    continue
-                attachments.append(file_item)
+                handler = _attachment_handler(type(attachment))
+                if handler is not None:
+                    attachments.append(handler(attachment))
             json_message['Attachments'] = attachments
 
         if self.__message_stream:
@@ -510,6 +626,26 @@ class PMMail(object):
         Pass test=True to just print out the resulting
         JSON message being sent to Postmark
         '''
+        request = self._prepare_send(test)
+        if request is None:
+            return
+
+        endpoint_url, payload = request
+        return_json = _return_json_setting(return_json)
+
+        # Attempt send
+        try:
+            result = _SESSION.post(endpoint_url, data=payload, headers=self._get_headers(), timeout=_TIMEOUT)
+        except requests.exceptions.RequestException as err:
+            raise _url_exception(err)
+
+        return self._handle_response(result, result.reason, return_json)
+
+    def _prepare_send(self, test):
+        '''
+        Check the message and return the endpoint URL and JSON payload
+        to post, or None if test mode only prints the message.
+        '''
         self._check_values()
 
         # Set up message dictionary
@@ -519,88 +655,199 @@ class PMMail(object):
         #     # TODO: Set up regex to strip html
         #     pass
 
-        # If test is not specified, attempt to read the Django setting
-        if test is None:
-            try:
-                from django.conf import settings as django_settings
-                test = getattr(django_settings, "POSTMARK_TEST_MODE", None)
-            except ImportError:
-                pass
-
         # If this is a test, just print the message
-        if test:
+        if _test_setting(test):
             print('JSON message is:\n%s' % json.dumps(json_message, cls=PMJSONEncoder))
-            return
+            return None
 
         if self.__template_id or self.__template_alias:
             endpoint_url = __POSTMARK_URL__ + 'email/withTemplate/'
         else:
             endpoint_url = __POSTMARK_URL__ + 'email'
 
-        """
-        Args:
-            return_json (bool | None):
-                True  -> return parsed JSON
-                False -> return True/False
-                None  -> fallback to settings.POSTMARK_RETURN_JSON (default False)
-        """
+        return endpoint_url, _json_dumps(json_message)
 
-        if return_json is None:
+    def _handle_response(self, result, reason, return_json):
+        '''
+        Turn a Postmark response into send()'s return value, or raise
+        the matching exception.
+        '''
+        if result.status_code == 200:
+            parsed = _json_loads(result.content)
+            self.message_id = parsed.get("MessageID", None)
+            return parsed if return_json else True
+        elif result.status_code == 401:
+            raise PMMailUnauthorizedException('Sending Unauthorized - incorrect API key.', _http_error(result, reason))
+        elif result.status_code == 422:
             try:
-                from django.conf import settings as django_settings
-                return_json = getattr(django_settings, "POSTMARK_RETURN_JSON", False)
-            except ImportError:
-                return_json = False
-
-        # Set up the url Request
-        req = Request(
-            endpoint_url,
-            json.dumps(json_message, cls=PMJSONEncoder).encode('utf8'),
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
+                jsonobj = _json_loads(result.content)
+                desc = jsonobj['Message']
+                error_code = jsonobj['ErrorCode']
+            except KeyError:
+                raise PMMailUnprocessableEntityException('Unprocessable Entity: Description not given')
+
+            if error_code == 406:
+                raise PMMailInactiveRecipientException('You tried to send email to a recipient that has been marked as inactive.')
+
+            raise PMMailUnprocessableEntityException('Unprocessable Entity: %s' % desc)
+        elif result.status_code == 500:
+            raise PMMailServerErrorException('Internal server error at Postmark. Admins have been alerted.', _http_error(result, reason))
+        else:
+            raise PMMailSendException('Return code %d: %s' % (result.status_code, reason))
+
+
+def _tuple_attachment(attachment):
+    file_item = {
+        "Name": attachment[0],
+        "Content": attachment[1],
+        "ContentType": attachment[2],
+    }
+    # If need add Content-ID header:
+    if len(attachment) >= 4 and attachment[3]:
+        file_item["ContentID"] = attachment[3]
+    return file_item
+
+
+# Base64 content of MIME attachments, so resending a message does not
+# encode the same payload again. Entries go away with their attachment.
+_MIME_CONTENT = weakref.WeakKeyDictionary()
+
+
+def _mime_content(attachment):
+    payload = attachment.get_payload()
+    encoding = (attachment.get("Content-Transfer-Encoding") or "").lower()
+    cached = _MIME_CONTENT.get(attachment)
+    # Payloads are immutable strings, so the same object means the same content
+    if cached is not None and cached[0] is payload and cached[1] == encoding:
+        return cached[2]
+
+    if encoding == "base64":
+        # Already encoded, only drop the MIME line breaks
+        content = "".join(payload.split())
+    else:
+        content = b64encode(attachment.get_payload(decode=True)).decode("ascii")
+    _MIME_CONTENT[attachment] = (payload, encoding, content)
+    return content
+
+
+def _mime_attachment(attachment):
+    content = _mime_content(attachment)
+    file_item = {
+        "Name": attachment.get_filename(),
+        "Content": content,
+        "ContentType": attachment.get_content_type(),
+    }
+    content_id = attachment.get("Content-ID")
+    if content_id:
+        # Because postmarkapp api required clear value. Not enclosed in angle brackets:
+        if content_id.startswith("<") and content_id.endswith(">"):
+            content_id = content_id[1:-1]
+        # Postmarkapp will mark attachment as "inline" only if "ContentID" field starts with "cid":
+        if (attachment.get("Content-Disposition") or "").startswith("inline"):
+            content_id = "cid:%s" % content_id
+        file_item["ContentID"] = content_id
+    return file_item
+
+
+# Attachment converters by exact type. Subclasses (MIMEImage, Django's
+# SafeMIMEText, ...) are resolved once by _attachment_handler and cached here.
+_ATTACHMENT_HANDLERS = {
+    tuple: _tuple_attachment,
+    MIMEBase: _mime_attachment,
+}
+
+
+def _attachment_handler(attachment_type):
+    '''
+    Return the converter for an attachment type, or None if attachments
+    of that type are not supported and should be skipped.
+    '''
+    try:
+        return _ATTACHMENT_HANDLERS[attachment_type]
+    except KeyError:
+        pass
 
-        # Attempt send
+    if issubclass(attachment_type, tuple):
+        handler = _tuple_attachment
+    elif issubclass(attachment_type, MIMEBase):
+        handler = _mime_attachment
+    else:
+        handler = None
+    _ATTACHMENT_HANDLERS[attachment_type] = handler
+    return handler
+
+
+def _headers(cached, api_key, user_agent):
+    '''
+    Request headers, rebuilt only when the API key changes.
+    '''
+    if cached is None or cached['X-Postmark-Server-Token'] != api_key:
+        cached = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'X-Postmark-Server-Token': api_key,
+            'User-agent': user_agent
+        }
+    return cached
+
+
+def _http_error(result, reason):
+    '''
+    An HTTPError for a requests or httpx response, for use as an
+    exception's inner_exception or as a bounce API error result.
+    '''
+    return HTTPError(str(result.url), result.status_code, reason, result.headers, BytesIO(result.content))
+
+
+def _url_exception(err):
+    '''
+    The PMMailURLException for a requests or httpx transport error. Its
+    inner_exception is a URLError whose .reason is the original error.
+    '''
+    return PMMailURLException('URLError: Failed to reach the server: %s (See "inner_exception" for details)' % err, URLError(err))
+
+
+def _test_setting(test):
+    '''
+    If test is not specified, attempt to read the Django setting
+    '''
+    if test is None:
         try:
-            # print 'sending request to postmark: %s' % json_message
-            result = urlopen(req)
-            jsontxt = result.read().decode('utf8')
-            result.close()
-            if result.code == 200:
-                parsed = json.loads(jsontxt)
-                self.message_id = parsed.get("MessageID", None)
-                return parsed if return_json else True
-            else:
-                raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
-        except HTTPError as err:
-            if err.code == 401:
-                raise PMMailUnauthorizedException('Sending Unauthorized - incorrect API key.', err)
-            elif err.code == 422:
-                try:
-                    jsontxt = err.read().decode('utf8')
-                    jsonobj = json.loads(jsontxt)
-                    desc = jsonobj['Message']
-                    error_code = jsonobj['ErrorCode']
-                except KeyError:
-                    raise PMMailUnprocessableEntityException('Unprocessable Entity: Description not given')
-
-                if error_code == 406:
-                    raise PMMailInactiveRecipientException('You tried to send email to a recipient that has been marked as inactive.')
-
-                raise PMMailUnprocessableEntityException('Unprocessable Entity: %s' % desc)
-            elif err.code == 500:
-                raise PMMailServerErrorException('Internal server error at Postmark. Admins have been alerted.', err)
-        except URLError as err:
-            if hasattr(err, 'reason'):
-                raise PMMailURLException('URLError: Failed to reach the server: %s (See "inner_exception" for details)' % err.reason, err)
-            elif hasattr(err, 'code'):
-                raise PMMailURLException('URLError: %d: The server couldn\'t fufill the request. (See "inner_exception" for details)' % err.code, err)
-            else:
-                raise PMMailURLException('URLError: The server couldn\'t fufill the request. (See "inner_exception" for details)', err)
+            from django.conf import settings as django_settings
+            test = getattr(django_settings, "POSTMARK_TEST_MODE", None)
+        except (ImportError, _ImproperlyConfigured):
+            pass
+    return test
+
+
+def _return_json_setting(return_json):
+    """
+    Args:
+        return_json (bool | None):
+            True  -> return parsed JSON
+            False -> return True/False
+            None  -> fallback to settings.POSTMARK_RETURN_JSON (default False)
+    """
+    if return_json is None:
+        try:
+            from django.conf import settings as django_settings
+            return_json = getattr(django_settings, "POSTMARK_RETURN_JSON", False)
+        except (ImportError, _ImproperlyConfigured):
+            return_json = False
+    return return_json
+
+
+def _check_addresses(field, value):
+    '''
+    Make sure every address in a sender/recipient field could be an
+    e-mail address, so obviously bad input fails before a request is made.
+    '''
+    for name, address in getaddresses([value]):
+        if not name and not address:
+            # Empty entry, e.g. from a trailing separator
+            continue
+        if '@' not in address or not 3 <= len(address) <= 254 or not _EMAIL_RE.match(address):
+            raise PMMailInvalidValueException('Invalid e-mail address in .%s field: %s' % (field, address or value))
 
 
 # Simple utility that returns a generator to chunk up a list into equal parts
@@ -612,9 +859,14 @@ class PMBatchMail(object):
     # Maximum number of messages to be sent at once.
     # Ref: http://developer.postmarkapp.com/developer-build.html#batching-messages
     MAX_MESSAGES = 500
+    # Maximum number of chunks sent concurrently
+    MAX_WORKERS = 4
+
+    __slots__ = ('__api_key', '__headers', '__messages', '__template', '__user_agent')
 
     def __init__(self, **kwargs):
         self.__api_key = None
+        self.__headers = None
         self.__messages = []
         self.__template = False
 
@@ -628,7 +880,7 @@ class PMBatchMail(object):
                 setattr(self, '_PMBatchMail__%s' % key, kwargs[key])
 
         # Set up the user-agent
-        self.__user_agent = 'Python/%s (python-postmark library version %s)' % ('_'.join([str(var) for var in sys.version_info]), __version__)
+        self.__user_agent = _USER_AGENT
 
         # Try to pull in the API key from Django
         try:
@@ -637,7 +889,7 @@ class PMBatchMail(object):
             self.__user_agent = '%s (Django %s)' % (self.__user_agent, '_'.join([str(var) for var in VERSION]))
             if not self.__api_key and hasattr(django_settings, 'POSTMARK_API_KEY'):
                 self.__api_key = django_settings.POSTMARK_API_KEY
-        except ImportError:
+        except (ImportError, _ImproperlyConfigured):
             pass
 
     api_key = property(
@@ -693,110 +945,112 @@ class PMBatchMail(object):
             message._check_values()
 
     def send(self, test=None, return_json=None):
-        # Has one of the messages caused an inactive recipient error?
-        inactive_recipient = False
-
         # Check messages for completeness prior to attempting to send
         self._check_values()
 
-        # If test is not specified, attempt to read the Django setting
-        if test is None:
-            try:
-                from django.conf import settings as django_settings
-                test = getattr(django_settings, "POSTMARK_TEST_MODE", None)
-            except ImportError:
-                pass
-
-        """
-        Args:
-            return_json (bool | None):
-                True  -> return parsed JSON
-                False -> return True/False
-                None  -> fallback to settings.POSTMARK_RETURN_JSON (default False)
-        """
-
-        if return_json is None:
-            try:
-                from django.conf import settings as django_settings
-                return_json = getattr(django_settings, "POSTMARK_RETURN_JSON", False)
-            except ImportError:
-                return_json = False
+        test = _test_setting(test)
+        return_json = _return_json_setting(return_json)
 
         # Split up into groups of 500 messages for sending
-        for messages in _chunks(self.messages, PMBatchMail.MAX_MESSAGES):
-            json_message = []
-            for message in messages:
-                json_message.append(message.to_json_message())
-
-            if not self.__template:
-                endpoint_url = __POSTMARK_URL__ + 'email/batch'
-                payload = json.dumps(json_message, cls=PMJSONEncoder).encode('utf8')
+        chunks = list(_chunks(self.messages, PMBatchMail.MAX_MESSAGES))
+
+        # If this is a test, just print the messages
+        if test:
+            self._print_chunks(chunks)
+            return True
+
+        if len(chunks) > 1:
+            # Chunks are independent requests, so send them concurrently
+            with ThreadPoolExecutor(max_workers=min(len(chunks), PMBatchMail.MAX_WORKERS)) as executor:
+                chunk_results = list(executor.map(self._send_chunk, chunks))
+        else:
+            chunk_results = [self._send_chunk(messages) for messages in chunks]
+
+        return self._collect_results(chunk_results, return_json)
+
+    def _print_chunks(self, chunks):
+        for messages in chunks:
+            json_message = [message.to_json_message() for message in messages]
+            print('JSON message is:\n%s' % json.dumps(json_message, cls=PMJSONEncoder))
+
+    def _collect_results(self, chunk_results, return_json):
+        '''
+        Combine the per-chunk results into send()'s return value.
+        '''
+        # Has one of the messages caused an inactive recipient error?
+        inactive_recipient = False
+
+        results = []
+        for chunk_result in chunk_results:
+            if chunk_result is None:
+                # One of the message recipients was inactive. Postmark still sends the
+                # rest of the messages that have active recipients.
+                inactive_recipient = True
             else:
-                endpoint_url = __POSTMARK_URL__ + 'email/batchWithTemplates'
-                payload = json.dumps({'Messages': json_message}, cls=PMJSONEncoder).encode('utf8')
-
-            req = Request(
-                endpoint_url,
-                payload,
-                {
-                    'Accept': 'application/json',
-                    'Content-Type': 'application/json',
-                    'X-Postmark-Server-Token': self.__api_key,
-                    'User-agent': self.__user_agent
-                }
-            )
-
-            # If this is a test, just print the message
-            if test:
-                print('JSON message is:\n%s' % json.dumps(json_message, cls=PMJSONEncoder))
-                continue
-
-            # Attempt send
-            try:
-                result = urlopen(req)
-                jsontxt = result.read().decode()
-                result.close()
-                if result.code == 200:
-                    results = json.loads(jsontxt)
-                    for i, res in enumerate(results):
-                        self.__messages[i].message_id = res.get("MessageID", None)
-                    return results if return_json else True
-                else:
-                    raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
-            except HTTPError as err:
-                if err.code == 401:
-                    raise PMMailUnauthorizedException('Sending Unauthorized - incorrect API key.', err)
-                elif err.code == 422:
-                    try:
-                        jsontxt = err.read().decode()
-                        jsonobj = json.loads(jsontxt)
-                        desc = jsonobj['Message']
-                        error_code = jsonobj['ErrorCode']
-                    except KeyError:
-                        raise PMMailUnprocessableEntityException('Unprocessable Entity: Description not given')
-
-                    if error_code == 406:
-                        # One of the message recipients was inactive. Postmark still sends the
-                        # rest of the messages that have active recipients. Continue sending
-                        # the rest of the chunks.
-                        inactive_recipient = True
-                        continue
-
-                    raise PMMailUnprocessableEntityException('Unprocessable Entity: %s' % desc)
-                elif err.code == 500:
-                    raise PMMailServerErrorException('Internal server error at Postmark. Admins have been alerted.', err)
-            except URLError as err:
-                if hasattr(err, 'reason'):
-                    raise PMMailURLException('URLError: Failed to reach the server: %s (See "inner_exception" for details)' % err.reason, err)
-                elif hasattr(err, 'code'):
-                    raise PMMailURLException('URLError: %d: The server couldn\'t fufill the request. (See "inner_exception" for details)' % err.code, err)
-                else:
-                    raise PMMailURLException('URLError: The server couldn\'t fufill the request. (See "inner_exception" for details)', err)
+                results.extend(chunk_result)
 
         if inactive_recipient:
             raise PMMailInactiveRecipientException('You tried to send email to a recipient that has been marked as inactive.')
 
-        return True
+        return results if return_json else True
+
+    def _get_headers(self):
+        self.__headers = _headers(self.__headers, self.__api_key, self.__user_agent)
+        return self.__headers
+
+    def _send_chunk(self, messages):
+        '''
+        Send one chunk of at most MAX_MESSAGES messages. Returns the list of
+        per-message results, or None if one of the recipients was inactive.
+        '''
+        endpoint_url, payload = self._prepare_chunk(messages)
+
+        # Attempt send
+        try:
+            result = _SESSION.post(endpoint_url, data=payload, headers=self._get_headers(), timeout=_TIMEOUT)
+        except requests.exceptions.RequestException as err:
+            raise _url_exception(err)
+
+        return self._handle_chunk_response(messages, result, result.reason)
+
+    def _prepare_chunk(self, messages):
+        '''
+        Return the endpoint URL and JSON payload for one chunk of messages.
+        '''
+        json_message = [message.to_json_message() for message in messages]
+
+        if not self.__template:
+            return __POSTMARK_URL__ + 'email/batch', _json_dumps_messages(json_message)
+        return __POSTMARK_URL__ + 'email/batchWithTemplates', b'{"Messages": ' + _json_dumps_messages(json_message) + b'}'
+
+    def _handle_chunk_response(self, messages, result, reason):
+        '''
+        Turn the Postmark response for one chunk into its list of results,
+        None for an inactive recipient, or raise the matching exception.
+        '''
+        if result.status_code == 200:
+            results = _json_loads(result.content)
+            for message, res in zip(messages, results):
+                message.message_id = res.get("MessageID", None)
+            return results
+        elif result.status_code == 401:
+            raise PMMailUnauthorizedException('Sending Unauthorized - incorrect API key.', _http_error(result, reason))
+        elif result.status_code == 422:
+            try:
+                jsonobj = _json_loads(result.content)
+                desc = jsonobj['Message']
+                error_code = jsonobj['ErrorCode']
+            except KeyError:
+                raise PMMailUnprocessableEntityException('Unprocessable Entity: Description not given')
+
+            if error_code == 406:
+                return None
+
+            raise PMMailUnprocessableEntityException('Unprocessable Entity: %s' % desc)
+        elif result.status_code == 500:
+            raise PMMailServerErrorException('Internal server error at Postmark. Admins have been alerted.', _http_error(result, reason))
+        else:
+            raise PMMailSendException('Return code %d: %s' % (result.status_code, reason))
 
 
 class PMBounceManager(object):
@@ -804,6 +1058,8 @@ class PMBounceManager(object):
     The Postmark Bounce object.
     '''
 
+    __slots__ = ('__api_key', '__headers', '__user_agent')
+
     def __init__(self, **kwargs):
         '''
         Keyword arguments are:
@@ -811,6 +1067,7 @@ class PMBounceManager(object):
         '''
         # initialize properties
         self.__api_key = None
+        self.__headers = None
 
         acceptable_keys = (
             'api_key',
@@ -821,7 +1078,7 @@ class PMBounceManager(object):
                 setattr(self, '_PMBounceManager__%s' % key, kwargs[key])
 
         # Set up the user-agent
-        self.__user_agent = 'Python/%s (python-postmark library version %s)' % ('_'.join([str(var) for var in sys.version_info]), __version__)
+        self.__user_agent = _USER_AGENT
 
         # Try to pull in the API key from Django
         try:
@@ -830,7 +1087,7 @@ class PMBounceManager(object):
             if not self.__api_key and hasattr(django_settings, 'POSTMARK_API_KEY'):
                 self.__api_key = django_settings.POSTMARK_API_KEY
             self.__user_agent = '%s (Django %s)' % (self.__user_agent, '_'.join([str(var) for var in VERSION]))
-        except ImportError:
+        except (ImportError, _ImproperlyConfigured):
             pass
 
     def _check_values(self):
@@ -843,42 +1100,43 @@ class PMBounceManager(object):
 
     api_key = property(
         lambda self: self.__api_key,
-        lambda self, value: setattr(self, '_PMMail__api_key', value),
-        lambda self: setattr(self, '_PMMail__api_key', None),
+        lambda self, value: setattr(self, '_PMBounceManager__api_key', value),
+        lambda self: setattr(self, '_PMBounceManager__api_key', None),
         '''
         The API Key for your rack server on Postmark
         '''
     )
 
-    def delivery_stats(self):
+    def _get_headers(self):
+        self.__headers = _headers(self.__headers, self.__api_key, self.__user_agent)
+        return self.__headers
+
+    def _request(self, method, path, **kwargs):
         '''
-        Returns a summary of inactive emails and bounces by type.
+        Send a request to the bounce API through the shared session and
+        return the parsed JSON response. HTTP errors are returned, not raised.
         '''
         self._check_values()
 
-        req = Request(
-            __POSTMARK_URL__ + 'deliverystats',
-            None,
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
+        url = __POSTMARK_URL__ + path
 
-        # Attempt send
         try:
-            # print 'sending request to postmark:'
-            result = urlopen(req)
-            with closing(result):
-                if result.code == 200:
-                    return json.loads(result.read())
-                else:
-                    raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
+            result = _SESSION.request(method, url, headers=self._get_headers(), timeout=_TIMEOUT, **kwargs)
+        except requests.exceptions.RequestException as err:
+            raise _url_exception(err)
+
+        if result.status_code == 200:
+            return _json_loads(result.content)
+        elif result.status_code >= 400:
+            return _http_error(result, result.reason)
+        else:
+            raise PMMailSendException('Return code %d: %s' % (result.status_code, result.reason))
 
-        except HTTPError as err:
-            return err
+    def delivery_stats(self):
+        '''
+        Returns a summary of inactive emails and bounces by type.
+        '''
+        return self._request('GET', 'deliverystats')
 
     def get_all(self, inactive='', email_filter='', tag='', count=25, offset=0):
         '''
@@ -888,153 +1146,41 @@ class PMBounceManager(object):
         first, usually the first page, and the service will return the count in the TotalCount property
         of the response.
         '''
-
-        self._check_values()
-
-        params = '?inactive=' + inactive + '&emailFilter=' + email_filter +'&tag=' + tag
-        params += '&count=' + str(count) + '&offset=' + str(offset)
-
-        req = Request(
-            __POSTMARK_URL__ + 'bounces' + params,
-            None,
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
-
-        # Attempt send
-        try:
-            # print 'sending request to postmark:'
-            result = urlopen(req)
-            with closing(result):
-                if result.code == 200:
-                    return json.loads(result.read())
-                else:
-                    raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
-
-        except HTTPError as err:
-            return err
+        params = {
+            'inactive': inactive,
+            'emailFilter': email_filter,
+            'tag': tag,
+            'count': count,
+            'offset': offset,
+        }
+        return self._request('GET', 'bounces', params=params)
 
     def get_single(self, bounce_id):
         '''
         Get details about a single bounce. Note that the bounce ID is a numeric value that you
         typically obtain after a getting a list of bounces.
         '''
-        self._check_values()
-
-        req = Request(
-            __POSTMARK_URL__ + '/bounces/' + str(bounce_id),
-            None,
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
-
-        # Attempt send
-        try:
-            # print 'sending request to postmark:'
-            result = urlopen(req)
-            with closing(result):
-                if result.code == 200:
-                    return json.loads(result.read())
-                else:
-                    raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
-
-        except HTTPError as err:
-            return err
+        return self._request('GET', 'bounces/' + str(bounce_id))
 
     def get_dump(self, bounce_id):
         '''
         Returns the raw source of the bounce Postmark accepted. If Postmark does not have a dump for
         that bounce, it will return an empty string.
         '''
-        self._check_values()
-
-        req_url = __POSTMARK_URL__ + '/bounces/' + str(bounce_id) + '/dump'
-        # print req_url
-
-        req = Request(
-            req_url,
-            None,
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
-
-        # Attempt send
-        try:
-            print('sending request to postmark:')
-            result = urlopen(req)
-            with closing(result):
-                if result.code == 200:
-                    return json.loads(result.read())
-                else:
-                    raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
-
-        except HTTPError as err:
-            return err
+        return self._request('GET', 'bounces/' + str(bounce_id) + '/dump')
 
     def get_tags(self):
         '''
         Returns a list of tags used for the current server.
         '''
-        self._check_values()
-
-        req = Request(
-            __POSTMARK_URL__ + 'bounces/tags',
-            None,
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
-
-        # Attempt send
-        try:
-            # print 'sending request to postmark:'
-            result = urlopen(req)
-            with closing(result):
-                if result.code == 200:
-                    return json.loads(result.read())
-                else:
-                    raise PMMailSendException('Return code %d: %s' % (result.code, result.msg))
-
-        except HTTPError as err:
-            return err
+        return self._request('GET', 'bounces/tags')
 
     def activate(self, bounce_id):
         '''
         Activates a deactivated bounce.
         '''
-        self._check_values()
-        req_url = '/bounces/' + str(bounce_id) + '/activate'
-        # print req_url
-        h1 = HTTPConnection('api.postmarkapp.com')
         dta = urlencode({"data": "blank"}).encode('utf8')
-        h1.request(
-            'PUT',
-            req_url,
-            dta,
-            {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'X-Postmark-Server-Token': self.__api_key,
-                'User-agent': self.__user_agent
-            }
-        )
-        r = h1.getresponse()
-        return json.loads(r.read())
+        return self._request('PUT', 'bounces/' + str(bounce_id) + '/activate', data=dta)
 
 
 #
@@ -1048,6 +1194,13 @@ class PMMailMissingValueException(Exception):
         return repr(self.parameter)
 
 
+class PMMailInvalidValueException(PMMailMissingValueException):
+    '''
+    Raised when a value is set but malformed, e.g. an invalid e-mail address
+    '''
+    pass
+
+
 class PMMailSendException(Exception):
     '''
     Base Postmark send exception
@@ -1089,7 +1242,8 @@ class PMMailURLException(PMMailSendException):
     '''
     A URLError was caught - usually has to do with connectivity
     and the ability to reach the server.  The inner_exception will
-    have the base URLError object.
+    have a URLError object whose .reason is the requests (or httpx)
+    exception.
     '''
     pass
 
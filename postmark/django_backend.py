@@ -1,10 +1,11 @@
+import contextlib
+
 from django.conf import settings
 from django.core.mail.backends.base import BaseEmailBackend
 from django.core.exceptions import ImproperlyConfigured
 from django.core.mail import EmailMessage, EmailMultiAlternatives
-import base64
 
-from postmark.core import PMMail, PMBatchMail
+from postmark.core import PMMail, PMBatchMail, b64encode
 
 
 class PMEmailMessage(EmailMessage):
@@ -77,14 +78,29 @@ class EmailBackend(BaseEmailBackend):
             return
 
         sent, instance = self._send(email_messages)
+        return self._sent_result(sent, instance)
+
+    async def async_send_messages(self, email_messages):
+        """
+        Coroutine version of send_messages(), sending through httpx
+        (see postmark.async_core).
+        """
+        if not email_messages:
+            return
 
+        sent, instance = await self._async_send(email_messages)
+        return self._sent_result(sent, instance)
+
+    def _sent_result(self, sent, instance):
+        """A helper method to build the return value of send_messages()"""
         if sent and self.return_message_id:
             return [m.message_id for m in instance.messages]
         elif sent:
-            return len(email_messages)
+            # Messages without recipients are dropped before sending
+            return len(instance.messages)
         return 0
 
-    def _build_message(self, message):
+    def _build_message(self, message, mail_class=PMMail):
         """A helper method to convert a PMEmailMessage to a PMMail"""
         if not message.recipients():
             return False
@@ -120,55 +136,77 @@ class EmailBackend(BaseEmailBackend):
                         (f, content, m) = item
                         if isinstance(content, str):
                             content = content.encode()
-                        content = base64.b64encode(content)
-                        # b64decode returns bytes on Python 3. PMMail needs a
-                        # str (for JSON serialization). Convert on Python 3
-                        # only to avoid a useless performance hit on Python 2.
-                        if not isinstance(content, str):
-                            content = content.decode()
+                        # PMMail needs a str (for JSON serialization)
+                        content = b64encode(content).decode('ascii')
                         attachments.append((f, content, m))
                     else:
                         attachments.append(item)
 
         message_stream = getattr(message, 'message_stream', None)
-        postmark_message = PMMail(api_key=self.api_key,
-                                  subject=message.subject,
-                                  sender=message.from_email,
-                                  to=recipients,
-                                  cc=recipients_cc,
-                                  bcc=recipients_bcc,
-                                  text_body=text_body,
-                                  html_body=html_body,
-                                  reply_to=reply_to,
-                                  custom_headers=custom_headers,
-                                  attachments=attachments,
-                                  message_stream=message_stream)
+        postmark_message = mail_class(api_key=self.api_key,
+                                      subject=message.subject,
+                                      sender=message.from_email,
+                                      to=recipients,
+                                      cc=recipients_cc,
+                                      bcc=recipients_bcc,
+                                      text_body=text_body,
+                                      html_body=html_body,
+                                      reply_to=reply_to,
+                                      custom_headers=custom_headers,
+                                      attachments=attachments,
+                                      message_stream=message_stream)
 
         postmark_message.tag = getattr(message, 'tag', None)
         postmark_message.track_opens = getattr(message, 'track_opens', False)
 
         return postmark_message
 
-    def _send(self, messages):
-        """A helper method that does the actual sending."""
+    def _prepare(self, messages, mail_class=PMMail, batch_class=PMBatchMail):
+        """
+        A helper method that builds the object to send, or returns None
+        if none of the messages have recipients.
+        """
         if len(messages) == 1:
-            to_send = self._build_message(messages[0])
+            to_send = self._build_message(messages[0], mail_class)
             if to_send is False:
                 # The message was missing recipients.
                 # Bail.
-                return False, None
+                return None
         else:
-            pm_messages = list(map(self._build_message, messages))
+            pm_messages = [self._build_message(m, mail_class) for m in messages]
             pm_messages = [m for m in pm_messages if m]
             if len(pm_messages) == 0:
                 # If after filtering, there aren't any messages
                 # to send, bail.
-                return False, None
-            to_send = PMBatchMail(messages=pm_messages)
-        try:
+                return None
+            to_send = batch_class(messages=pm_messages)
+        return to_send
+
+    def _fail_silently(self):
+        """A context manager that swallows send errors if fail_silently is set"""
+        return contextlib.suppress(Exception) if self.fail_silently else contextlib.nullcontext()
+
+    def _send(self, messages):
+        """A helper method that does the actual sending."""
+        to_send = self._prepare(messages)
+        if to_send is None:
+            return False, None
+        with self._fail_silently():
             to_send.send(test=self.test_mode)
-        except:
-            if self.fail_silently:
-                return False, to_send
-            raise
-        return True, to_send
+            return True, to_send
+        return False, to_send
+
+    async def _async_send(self, messages):
+        """A helper method that does the actual sending, asynchronously."""
+        from postmark.async_core import AsyncPMMail, AsyncPMBatchMail, _new_client
+
+        to_send = self._prepare(messages, AsyncPMMail, AsyncPMBatchMail)
+        if to_send is None:
+            return False, None
+        with self._fail_silently():
+            # Django may run each call on a new event loop (async_to_sync),
+            # so use a client that is closed with this call
+            async with _new_client() as client:
+                await to_send.send(test=self.test_mode, client=client)
+            return True, to_send
+        return False, to_send
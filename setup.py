@@ -10,6 +10,8 @@ setup(
     name="python-postmark",
     version=postmark['__version__'],
     packages=['postmark'],
+    install_requires=['requests'],
+    extras_require={'async': ['httpx[http2]']},
     author="Dave Martorana (http://davemartorana.com), Richard Cooper (http://frozenskys.com), Bill Jones (oraclebill), Dmitry Golomidov (deeGraYve)",
     author_email="themartorana@gmail.com",
     license='BSD',
@@ -1,77 +1,97 @@
+import asyncio
+import base64
 import json
-import sys
 import unittest
 from email.mime.image import MIMEImage
-
-from io import BytesIO
-
-from django.core import mail
-from django.core.mail import EmailMultiAlternatives, EmailMessage
-from django.test import TestCase
-
-from postmark.django_backend import EmailBackend
-
-if sys.version_info[0] < 3:
-    from StringIO import StringIO
-    from urllib2 import HTTPError
-else:
-    from io import StringIO
-    from urllib.error import HTTPError
+from email.mime.text import MIMEText
+from urllib.error import HTTPError, URLError
 
 import mock
+import requests
 
-from unittest.mock import MagicMock
+try:
+    from postmark import async_core
+    from postmark.async_core import AsyncPMBatchMail, AsyncPMMail
+except ImportError:
+    async_core = AsyncPMMail = AsyncPMBatchMail = None
 
 from postmark import (
     PMBatchMail, PMMail, PMMailInactiveRecipientException,
     PMMailUnprocessableEntityException, PMMailServerErrorException,
-    PMMailMissingValueException, PMBounceManager
+    PMMailMissingValueException, PMMailInvalidValueException, PMMailURLException, PMBounceManager
 )
+from postmark.core import _SESSION, _json_dumps
+
+
+FAKE_SINGLE_OK = json.dumps({
+    "To": "to@example.com",
+    "SubmittedAt": "2025-09-18T10:00:00Z",
+    "MessageID": "abc-123",
+    "ErrorCode": 0,
+    "Message": "OK"
+}).encode("utf-8")
+
+PAYLOAD_406 = b'{"Message": "", "ErrorCode": 406}'
+PAYLOAD_422 = b'{"Message": "", "ErrorCode": 422}'
+
 
-from django.conf import settings
+class FakeResponse(object):
+    """Minimal stand-in for a requests.Response or httpx.Response."""
+    reason = ''
+    reason_phrase = ''
+    url = ''
+
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {}
 
 
 def make_fake_response(payload, code=200):
     """Helper to fake an HTTP response object."""
-    mock = MagicMock()
-    mock.code = code
-    mock.read.return_value = json.dumps(payload).encode("utf-8")
-    mock.close.return_value = None
-    return mock
+    return FakeResponse(json.dumps(payload).encode("utf-8"), code)
 
 
 class PMMailTests(unittest.TestCase):
-    def test_406_error_inactive_recipient(self):
-        json_payload = BytesIO()
-        json_payload.write(b'{"Message": "", "ErrorCode": 406}')
-        json_payload.seek(0)
+    def setUp(self):
+        patcher = mock.patch.object(_SESSION, 'post', return_value=FakeResponse(FAKE_SINGLE_OK))
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
 
+    def test_406_error_inactive_recipient(self):
         message = PMMail(sender='from@example.com', to='to@example.com',
             subject='Subject', text_body='Body', api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            422, '', {}, json_payload)):
-            self.assertRaises(PMMailInactiveRecipientException, message.send)
+        self.mock_post.return_value = FakeResponse(PAYLOAD_406, 422)
+        self.assertRaises(PMMailInactiveRecipientException, message.send)
 
     def test_422_error_unprocessable_entity(self):
-        json_payload = BytesIO()
-        json_payload.write(b'{"Message": "", "ErrorCode": 422}')
-        json_payload.seek(0)
-
         message = PMMail(sender='from@example.com', to='to@example.com',
             subject='Subject', text_body='Body', api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            422, '', {}, json_payload)):
-            self.assertRaises(PMMailUnprocessableEntityException, message.send)
+        self.mock_post.return_value = FakeResponse(PAYLOAD_422, 422)
+        self.assertRaises(PMMailUnprocessableEntityException, message.send)
 
     def test_500_error_server_error(self):
         message = PMMail(sender='from@example.com', to='to@example.com',
             subject='Subject', text_body='Body', api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            500, '', {}, None)):
-            self.assertRaises(PMMailServerErrorException, message.send)
+        self.mock_post.return_value = FakeResponse(b'{}', 500)
+        with self.assertRaises(PMMailServerErrorException) as cm:
+            message.send()
+        self.assertIsInstance(cm.exception.inner_exception, HTTPError)
+        self.assertEqual(500, cm.exception.inner_exception.code)
+
+    def test_connection_error(self):
+        message = PMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', api_key='test')
+
+        error = requests.exceptions.ConnectionError('refused')
+        self.mock_post.side_effect = error
+        with self.assertRaises(PMMailURLException) as cm:
+            message.send()
+        self.assertIsInstance(cm.exception.inner_exception, URLError)
+        self.assertIs(error, cm.exception.inner_exception.reason)
 
     def assert_missing_value_exception(self, message_func, error_message):
         with self.assertRaises(PMMailMissingValueException) as cm:
@@ -83,9 +103,7 @@ class PMMailTests(unittest.TestCase):
         message = PMMail(sender='from@example.com', to='to@example.com',
             subject='Subject', text_body='Body', api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            200, '', {}, None)):
-            message.send()
+        message.send()
 
     def test_missing_subject(self):
         # No subject should raise exception when using send()
@@ -105,12 +123,57 @@ class PMMailTests(unittest.TestCase):
             'Cannot send an e-mail without at least one recipient (.to field or .bcc field)'
         )
 
+    def test_invalid_recipient_address(self):
+        message = PMMail(sender='from@example.com', to='to@example.com, not-an-address',
+                         subject='test', text_body='Body', api_key='test')
+        self.assert_missing_value_exception(
+            message.send,
+            'Invalid e-mail address in .to field: not-an-address'
+        )
+
+    def test_invalid_recipient_exception_type(self):
+        message = PMMail(sender='from@example.com', to='not-an-address',
+                         subject='test', text_body='Body', api_key='test')
+        self.assertRaises(PMMailInvalidValueException, message.send)
+
+    def test_trailing_address_separator(self):
+        message = PMMail(sender='from@example.com', to='to@example.com, ',
+                         subject='test', text_body='Body', api_key='test')
+        message._check_values()
+
+    def test_invalid_recipient_domain(self):
+        message = PMMail(sender='from@example.com', to='to@example..com',
+                         subject='test', text_body='Body', api_key='test')
+        self.assert_missing_value_exception(
+            message.send,
+            'Invalid e-mail address in .to field: to@example..com'
+        )
+
+    def test_named_recipient_addresses(self):
+        message = PMMail(sender='"Sender, The" <from@example.com>',
+                         to='First Last <to@example.com>, other@example.com',
+                         subject='test', text_body='Body', api_key='test')
+        message._check_values()
+
+    def test_documented_sender_format(self):
+        message = PMMail(sender='From Name <from@emailaddress.com>', to='to@example.com',
+                         subject='test', text_body='Body', api_key='test')
+        message._check_values()
+
+    def test_invalid_address_stops_batch(self):
+        messages = [
+            PMMail(sender='from@example.com', to=to, subject='test', text_body='Body', api_key='test')
+            for to in ('to@example.com', 'not-an-address')
+        ]
+        batch = PMBatchMail(messages=messages, api_key='test')
+        self.assertRaises(PMMailInvalidValueException, batch.send)
+        self.assertFalse(self.mock_post.called)
+
     def test_missing_to_field_but_populated_bcc_field(self):
         # No to field but populated bcc field should not raise exception when using send()
         message = PMMail(sender='from@example.com', subject='test', bcc='to@example.com',
                          text_body='Body', api_key='test')
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)):
-            message.send()
+        message.send()
 
     def test_check_values_bad_template_data(self):
         # Try sending with template ID only
@@ -124,9 +187,7 @@ class PMMailTests(unittest.TestCase):
         # Both template_id and template_model are set, so send should work.
         message = PMMail(api_key='test', sender='from@example.com', to='to@example.com',
                          template_id=1, template_model={'junk': 'more junk'})
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            200, '', {}, None)):
-            message.send()
+        message.send()
 
     def test_check_values_bad_template_alias_data(self):
         client = PMMail(api_key='test', sender='from@example.com', to='to@example.com', template_alias='my-template-alias')
@@ -148,8 +209,7 @@ class PMMailTests(unittest.TestCase):
             template_alias='my-template-alias',
             template_model={'junk': 'more junk'},
         )
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)):
-            message.send()
+        message.send()
 
     def test_inline_attachments(self):
         image = MIMEImage(b'image_file', 'png', name='image.png')
@@ -179,14 +239,85 @@ class PMMailTests(unittest.TestCase):
         assert len(json_message['Attachments']) == len(expected)
         for orig, attachment in zip(expected, json_message['Attachments']):
             for k, v in orig.items():
-                assert orig[k] == attachment[k].rstrip()
+                assert orig[k] == attachment[k]
+
+    def test_json_message_follows_in_place_changes(self):
+        message = PMMail(sender='from@example.com', to='to@example.com', api_key='test',
+            template_id=1, template_model={'name': 'Name'})
+        message.to_json_message()
+
+        message.template_model['name'] = 'Changed'
+        message.custom_headers['X-Test'] = 'test'
+        message.attachments.append(('TextFile', 'content', 'text/plain'))
+
+        json_message = message.to_json_message()
+        self.assertEqual({'name': 'Changed'}, json_message['TemplateModel'])
+        self.assertEqual([{'Name': 'X-Test', 'Value': 'test'}], json_message['Headers'])
+        self.assertEqual(['TextFile'], [a['Name'] for a in json_message['Attachments']])
+
+    def test_mime_attachment_encoded_once(self):
+        text = MIMEText('hello', 'plain')
+        message = PMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', api_key='test', attachments=[text])
+
+        with mock.patch('postmark.core.b64encode', wraps=base64.b64encode) as mock_b64encode:
+            message.to_json_message()
+            message.to_json_message()
+            self.assertEqual(1, mock_b64encode.call_count)
+
+            text.set_payload('changed')
+            self.assertEqual('Y2hhbmdlZA==', message.to_json_message()['Attachments'][0]['Content'])
+
+    def test_unsupported_attachments_skipped(self):
+        attachments = PMMail(
+            sender='from@example.com', to='to@example.com', subject='Subject', text_body='Body', api_key='test',
+            attachments=['not-an-attachment', ('TextFile', 'content', 'text/plain')]
+        ).to_json_message()['Attachments']
+        self.assertEqual(['TextFile'], [a['Name'] for a in attachments])
+
+    def test_mime_attachment_content_is_unwrapped(self):
+        data = bytes(range(256)) * 4
+        image = MIMEImage(data, 'png', name='image.png')
+        text = MIMEText('hello', 'plain')
+        text.add_header('Content-Disposition', 'attachment', filename='hello.txt')
+
+        attachments = PMMail(
+            sender='from@example.com', to='to@example.com', subject='Subject', text_body='Body', api_key='test',
+            attachments=[image, text]
+        ).to_json_message()['Attachments']
+        self.assertEqual(base64.b64encode(data).decode('ascii'), attachments[0]['Content'])
+        self.assertEqual('aGVsbG8=', attachments[1]['Content'])
+
+    def test_headers_follow_api_key(self):
+        message = PMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', api_key='test')
+
+        headers = message._get_headers()
+        self.assertIs(headers, message._get_headers())
+
+        message.api_key = 'other'
+        self.assertEqual('other', message._get_headers()['X-Postmark-Server-Token'])
+
+    def test_requests_accept_gzip(self):
+        message = PMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', api_key='test')
+        request = _SESSION.prepare_request(requests.Request(
+            'POST', 'https://api.postmarkapp.com/email', headers=message._get_headers()))
+        self.assertIn('gzip', request.headers['Accept-Encoding'])
 
     def test_send_metadata(self):
         message = PMMail(api_key='test', sender='from@example.com', to='to@example.com',
                          subject='test', text_body='test', metadata={'test': 'test'})
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            200, '', {}, None)):
-            message.send()
+        message.send()
+
+    def test_no_instance_dict(self):
+        message = PMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', metadata={'test': 'test'})
+        self.assertFalse(hasattr(message, '__dict__'))
+        self.assertRaises(AttributeError, setattr, message, 'unknown', 1)
+
+        del message.metadata
+        self.assertEqual({}, message.metadata)
 
     def test_send_metadata_invalid_format(self):
         self.assertRaises(TypeError, PMMail, api_key='test', sender='from@example.com', to='to@example.com',
@@ -209,22 +340,26 @@ class PMMailTests(unittest.TestCase):
             text_body="Testing single mail return",
         )
 
-        with mock.patch("postmark.core.urlopen") as mock_urlopen:
-            mock_urlopen.return_value = make_fake_response(fake_payload)
+        self.mock_post.return_value = make_fake_response(fake_payload)
 
-            # Test boolean return
-            result = mail.send()
-            self.assertTrue(result)
+        # Test boolean return
+        result = mail.send()
+        self.assertTrue(result)
 
-            # Test JSON return explicitly
-            result_json = mail.send(return_json=True)
-            self.assertIsInstance(result_json, dict)
-            self.assertEqual(result_json["ErrorCode"], 0)
-            self.assertEqual(result_json["Message"], "OK")
+        # Test JSON return explicitly
+        result_json = mail.send(return_json=True)
+        self.assertIsInstance(result_json, dict)
+        self.assertEqual(result_json["ErrorCode"], 0)
+        self.assertEqual(result_json["Message"], "OK")
 
 
 
 class PMBatchMailTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(_SESSION, 'post', return_value=FakeResponse(FAKE_SINGLE_OK))
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_406_error_inactive_recipient(self):
         messages = [
             PMMail(
@@ -237,15 +372,10 @@ class PMBatchMailTests(unittest.TestCase):
             ),
         ]
 
-        json_payload = BytesIO()
-        json_payload.write(b'{"Message": "", "ErrorCode": 406}')
-        json_payload.seek(0)
-
         batch = PMBatchMail(messages=messages, api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            422, '', {}, json_payload)):
-            self.assertRaises(PMMailInactiveRecipientException, batch.send)
+        self.mock_post.return_value = FakeResponse(PAYLOAD_406, 422)
+        self.assertRaises(PMMailInactiveRecipientException, batch.send)
 
     def test_422_error_unprocessable_entity(self):
         messages = [
@@ -259,15 +389,10 @@ class PMBatchMailTests(unittest.TestCase):
             ),
         ]
 
-        json_payload = BytesIO()
-        json_payload.write(b'{"Message": "", "ErrorCode": 422}')
-        json_payload.seek(0)
-
         batch = PMBatchMail(messages=messages, api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            422, '', {}, json_payload)):
-            self.assertRaises(PMMailUnprocessableEntityException, batch.send)
+        self.mock_post.return_value = FakeResponse(PAYLOAD_422, 422)
+        self.assertRaises(PMMailUnprocessableEntityException, batch.send)
 
     def test_500_error_server_error(self):
         messages = [
@@ -283,9 +408,8 @@ class PMBatchMailTests(unittest.TestCase):
 
         batch = PMBatchMail(messages=messages, api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('',
-            500, '', {}, None)):
-            self.assertRaises(PMMailServerErrorException, batch.send)
+        self.mock_post.return_value = FakeResponse(b'{}', 500)
+        self.assertRaises(PMMailServerErrorException, batch.send)
 
     def test_batch_mail_returns_results(self):
         fake_payload = [
@@ -308,278 +432,173 @@ class PMBatchMailTests(unittest.TestCase):
         # pass list of PMMail objects to PMBatchMail
         batch = PMBatchMail(api_key="test-api-key", messages=[message])
 
-        with mock.patch("postmark.core.urlopen") as mock_urlopen:
-            mock_urlopen.return_value = make_fake_response(fake_payload)
+        self.mock_post.return_value = make_fake_response(fake_payload)
 
-            # Test boolean return
-            results = batch.send()
-            self.assertTrue(results)
+        # Test boolean return
+        results = batch.send()
+        self.assertTrue(results)
 
-            # Test JSON return explicitly
-            results_json = batch.send(return_json=True)
-            self.assertIsInstance(results_json, list)
-            self.assertEqual(results_json[0]["ErrorCode"], 0)
+        # Test JSON return explicitly
+        results_json = batch.send(return_json=True)
+        self.assertIsInstance(results_json, list)
+        self.assertEqual(results_json[0]["ErrorCode"], 0)
 
 
+    def test_batch_mail_sends_every_chunk(self):
+        messages = [
+            PMMail(
+                sender='from@example.com', to='to%d@example.com' % i,
+                subject='Subject', text_body='Body', api_key='test'
+            )
+            for i in range(5)
+        ]
+        batch = PMBatchMail(messages=messages, api_key='test')
 
-class PMBounceManagerTests(unittest.TestCase):
-    def test_activate(self):
-        bounce = PMBounceManager(api_key='test')
+        def fake_post(url, data, **kwargs):
+            return make_fake_response([
+                {"To": m["To"], "MessageID": m["To"], "ErrorCode": 0, "Message": "OK"}
+                for m in json.loads(data.decode('utf-8'))
+            ])
 
-        with mock.patch('postmark.core.HTTPConnection.request') as mock_request:
-            with mock.patch('postmark.core.HTTPConnection.getresponse') as mock_response:
-                mock_response.return_value = StringIO('{"test": "test"}')
-                self.assertEqual(bounce.activate(1), {'test': 'test'})
+        with mock.patch.object(PMBatchMail, 'MAX_MESSAGES', 2):
+            self.mock_post.side_effect = fake_post
+            results = batch.send(return_json=True)
 
+        self.assertEqual(3, self.mock_post.call_count)
+        self.assertEqual(['to%d@example.com' % i for i in range(5)], [r["To"] for r in results])
+        self.assertEqual(['to%d@example.com' % i for i in range(5)], [m.message_id for m in messages])
 
-class EmailBackendTests(TestCase):
+    def test_batch_payload_with_shared_fields(self):
+        html_body = '<p>Shared body</p>' * 100
+        messages = [
+            PMMail(
+                sender='from@example.com', to='to%d@example.com' % i, api_key='test', html_body=html_body,
+                template_id=1, template_model={'name': 'Name %d' % i}
+            )
+            for i in range(3)
+        ]
+        messages.append(PMMail(
+            sender='from@example.com', to='to@example.com', api_key='test', html_body=html_body,
+            template_id=1, template_model={'name': 'Name'}, tag='other'
+        ))
+        batch = PMBatchMail(messages=messages, api_key='test')
 
-    def test_send_multi_alternative_html_email(self):
-        # build a message and send it
-        message = EmailMultiAlternatives(
-            connection=EmailBackend(api_key='dummy'),
-            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='hello there'
-        )
-        message.attach_alternative('<b>hello</b> there', 'text/html')
+        self.mock_post.return_value = make_fake_response([{"ErrorCode": 0}] * 4)
+        with mock.patch('postmark.core.orjson', None), \
+                mock.patch('postmark.core._json_dumps', wraps=_json_dumps) as mock_dumps:
+            batch.send()
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)) as transport:
-            message.send()
-            data = json.loads(transport.call_args[0][0].data.decode('utf-8'))
-            self.assertEqual('hello there', data['TextBody'])
-            self.assertEqual('<b>hello</b> there', data['HtmlBody'])
-
-    def test_send_content_subtype_email(self):
-        # build a message and send it
-        message = EmailMessage(
-            connection=EmailBackend(api_key='dummy'),
-            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-        )
-        message.content_subtype = 'html'
+        # Messages are serialized one by one around the spliced shared fields,
+        # never as a single dump of the whole list
+        self.assertTrue(all(isinstance(call[0][0], dict) for call in mock_dumps.call_args_list))
+        data = json.loads(self.mock_post.call_args[1]['data'].decode('utf-8'))
+        self.assertEqual({'Messages': [m.to_json_message() for m in messages]}, data)
+        self.assertTrue(self.mock_post.call_args[0][0].endswith('email/batchWithTemplates'))
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)) as transport:
-            message.send()
-            data = json.loads(transport.call_args[0][0].data.decode('utf-8'))
-            self.assertEqual('<b>hello</b> there', data['HtmlBody'])
-            self.assertFalse('TextBody' in data)
-
-    def test_send_multi_alternative_with_subtype_html_email(self):
-        """
-        Client uses EmailMultiAlternative but instead of specifying a html alternative they insert html content
-        into the main message and specify message_subtype
-        :return:
-        """
-        message = EmailMultiAlternatives(
-            connection=EmailBackend(api_key='dummy'),
-            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-        )
-        # NO alternatives attached.  subtype specified instead
-        message.content_subtype = 'html'
+    def test_batch_payload_keeps_value_types(self):
+        messages = [
+            PMMail(sender='from@example.com', to='to@example.com', api_key='test',
+                html_body='<p>Shared body</p>' * 100, template_id=1, template_model={'flag': flag})
+            for flag in (1, True, 1.0)
+        ]
+        batch = PMBatchMail(messages=messages, api_key='test')
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)) as transport:
-            message.send()
-            data = json.loads(transport.call_args[0][0].data.decode('utf-8'))
-            self.assertFalse('TextBody' in data)
-            self.assertEqual('<b>hello</b> there', data['HtmlBody'])
-
-    def test_message_count_single(self):
-        """Test backend returns count sending single message."""
-        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
-            message = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-            )
-            
-            with mock.patch('postmark.core.urlopen') as transport:
-                transport.return_value.read.return_value.decode.return_value = """
-                    {
-                      "To": "recipient@test.com",
-                      "SubmittedAt": "2014-02-17T07:25:01.4178645-05:00",
-                      "MessageID": "0a129aee-e1cd-480d-b08d-4f48548ff48d",
-                      "ErrorCode": 0,
-                      "Message": "OK"
-                    }
-                    """
-                transport.return_value.code = 200
-                response = message.send()
-                self.assertEqual(response, 1)
-
-    def test_message_count_batch(self):
-        """Test backend returns count sending batch messages."""
-        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
-
-            message1 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-            )
-            message2 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-            )
+        self.mock_post.return_value = make_fake_response([{"ErrorCode": 0}] * 3)
+        with mock.patch('postmark.core.orjson', None):
+            batch.send()
 
-            with mock.patch('postmark.core.urlopen') as transport:
-                transport.return_value.read.return_value.decode.return_value = """
-                    [
-                      {
-                        "ErrorCode": 0,
-                        "Message": "OK",
-                        "MessageID": "b7bc2f4a-e38e-4336-af7d-e6c392c2f817",
-                        "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
-                        "To": "receiver1@example.com"
-                      },
-                      {
-                        "ErrorCode": 0,
-                        "Message": "OK",
-                        "MessageID": "e2ecbbfc-fe12-463d-b933-9fe22915106d",
-                        "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
-                        "To": "receiver2@example.com"
-                      }
-                    ]
-                    """
-                transport.return_value.code = 200
-
-                # Directly send bulk mail via django
-                connection = mail.get_connection()
-                sent_messages = connection.send_messages([message1, message2])
-                self.assertEqual(sent_messages, 2)
-
-    def test_send_messages_nothing_to_send_single(self):
-        """Make sure no errors when send results in zero messages."""
-        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
-            message1 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
-            )
+        data = self.mock_post.call_args[1]['data'].decode('utf-8')
+        self.assertIn('{"flag":1}', data.replace(' ', ''))
+        self.assertIn('{"flag":true}', data.replace(' ', ''))
+        self.assertIn('{"flag":1.0}', data.replace(' ', ''))
 
-            with mock.patch('postmark.core.urlopen') as transport:
-                # Directly send bulk mail via django
-                connection = mail.get_connection()
-                sent_messages = connection.send_messages([message1])
-                self.assertEqual(0, sent_messages)
-
-    def test_send_messages_nothing_to_send_double(self):
-        """Make sure no errors when send results in zero messages."""
-        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
-            message1 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
-            )
 
-            message2 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
-            )
+@unittest.skipIf(AsyncPMMail is None, 'httpx is not installed')
+class AsyncPMMailTests(unittest.IsolatedAsyncioTestCase):
+    async def test_mail_returns_result(self):
+        message = AsyncPMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', api_key='test')
 
-            with mock.patch('postmark.core.urlopen') as transport:
-                # Directly send bulk mail via django
-                connection = mail.get_connection()
-                sent_messages = connection.send_messages([message1, message2])
-                self.assertEqual(0, sent_messages)
-
-    def test_message_id_single(self):
-        """Test backend returns message sending single message with setting True"""
-        with self.settings(POSTMARK_RETURN_MESSAGE_ID=True):
-            message = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-            )
-            
-            with mock.patch('postmark.core.urlopen') as transport:
-                transport.return_value.read.return_value.decode.return_value = """
-                    {
-                      "To": "recipient@test.com",
-                      "SubmittedAt": "2014-02-17T07:25:01.4178645-05:00",
-                      "MessageID": "0a129aee-e1cd-480d-b08d-4f48548ff48d",
-                      "ErrorCode": 0,
-                      "Message": "OK"
-                    }
-                    """
-                transport.return_value.code = 200
-                message_ids = message.send()
-                self.assertEqual(message_ids[0], "0a129aee-e1cd-480d-b08d-4f48548ff48d")
-
-    def test_message_id_batch(self):
-        """Test backend returns message sending batch messages with setting True"""
-        with self.settings(POSTMARK_RETURN_MESSAGE_ID=True):
-
-            message1 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
-            )
-            message2 = EmailMessage(
-                connection=EmailBackend(api_key='dummy'),
-                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+        with mock.patch('httpx.AsyncClient.post',
+            new=mock.AsyncMock(return_value=FakeResponse(FAKE_SINGLE_OK))) as mock_post:
+            result = await message.send(return_json=True)
+
+        self.assertEqual('abc-123', result['MessageID'])
+        self.assertEqual('abc-123', message.message_id)
+        self.assertEqual('https://api.postmarkapp.com/email', mock_post.call_args[0][0])
+
+    async def test_406_error_inactive_recipient(self):
+        message = AsyncPMMail(sender='from@example.com', to='to@example.com',
+            subject='Subject', text_body='Body', api_key='test')
+
+        with mock.patch('httpx.AsyncClient.post',
+            new=mock.AsyncMock(return_value=FakeResponse(PAYLOAD_406, 422))):
+            with self.assertRaises(PMMailInactiveRecipientException):
+                await message.send()
+
+    async def test_batch_mail_returns_results(self):
+        messages = [
+            PMMail(
+                sender='from@example.com', to='to%d@example.com' % i,
+                subject='Subject', text_body='Body', api_key='test'
             )
+            for i in range(3)
+        ]
+        batch = AsyncPMBatchMail(messages=messages, api_key='test')
 
-            with mock.patch('postmark.core.urlopen') as transport:
-                transport.return_value.read.return_value.decode.return_value = """
-                    [
-                      {
-                        "ErrorCode": 0,
-                        "Message": "OK",
-                        "MessageID": "b7bc2f4a-e38e-4336-af7d-e6c392c2f817",
-                        "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
-                        "To": "receiver1@example.com"
-                      },
-                      {
-                        "ErrorCode": 0,
-                        "Message": "OK",
-                        "MessageID": "e2ecbbfc-fe12-463d-b933-9fe22915106d",
-                        "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
-                        "To": "receiver2@example.com"
-                      }
-                    ]
-                    """
-                transport.return_value.code = 200
-
-                # Directly send bulk mail via django
-                connection = mail.get_connection()
-                sent_messages = connection.send_messages([message1, message2])
-                self.assertIn('b7bc2f4a-e38e-4336-af7d-e6c392c2f817', sent_messages)
-                self.assertIn('e2ecbbfc-fe12-463d-b933-9fe22915106d', sent_messages)
-
-    def test_send_attachment_bytes(self):
-        message = EmailMultiAlternatives(
-            connection=EmailBackend(api_key='dummy'),
-            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='hello there'
-        )
+        async def fake_post(url, content, **kwargs):
+            return make_fake_response([
+                {"To": m["To"], "MessageID": m["To"], "ErrorCode": 0, "Message": "OK"}
+                for m in json.loads(content.decode('utf-8'))
+            ])
 
-        f = StringIO(u'1,2,3')
-        message.attach('filename.csv', f.read(), 'text/csv')
+        with mock.patch.object(PMBatchMail, 'MAX_MESSAGES', 2):
+            with mock.patch('httpx.AsyncClient.post', side_effect=fake_post) as mock_post:
+                results = await batch.send(return_json=True)
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)):
-            message.send()
+        self.assertEqual(2, mock_post.call_count)
+        self.assertEqual(['to%d@example.com' % i for i in range(3)], [r["To"] for r in results])
 
-    def test_message_stream(self):
-        message = EmailMultiAlternatives(
-            connection=EmailBackend(api_key='dummy'),
-            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='hello there'
-        )
-        message.attach_alternative('<b>hello</b> there', 'text/html')
-        message.message_stream = 'broadcast'
+    async def test_client_per_event_loop(self):
+        async def other_loop_client():
+            client = async_core._client()
+            await async_core.aclose()
+            return client
 
-        with mock.patch('postmark.core.urlopen', side_effect=HTTPError('', 200, '', {}, None)) as transport:
-            message.send()
-            data = json.loads(transport.call_args[0][0].data.decode('utf-8'))
-            self.assertEqual('broadcast', data['MessageStream'])
-            self.assertEqual('hello there', data['TextBody'])
-            self.assertEqual('<b>hello</b> there', data['HtmlBody'])
+        client = async_core._client()
+        self.assertIs(client, async_core._client())
+        self.assertIsNot(client, await asyncio.to_thread(asyncio.run, other_loop_client()))
 
+        await async_core.aclose()
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(client, async_core._client())
+        await async_core.aclose()
 
 
-if __name__ == '__main__':
-    if not settings.configured:
-        settings.configure(
-            DATABASES={
-                'default': {
-                    'ENGINE': 'django.db.backends.sqlite3',
-                    'NAME': ':memory:'
-                }
-            },
-            INSTALLED_APPS=[
-            ],
-            MIDDLEWARE_CLASSES=[],
-            EMAIL_BACKEND = 'postmark.django_backend.EmailBackend',
-            POSTMARK_API_KEY='dummy',
-        )
+class PMBounceManagerTests(unittest.TestCase):
+    def test_activate(self):
+        bounce = PMBounceManager(api_key='test')
+
+        with mock.patch('postmark.core._SESSION.request',
+            return_value=make_fake_response({'test': 'test'})) as mock_request:
+            self.assertEqual(bounce.activate(1), {'test': 'test'})
+            self.assertEqual('PUT', mock_request.call_args[0][0])
+            self.assertEqual('https://api.postmarkapp.com/bounces/1/activate', mock_request.call_args[0][1])
 
+    def test_set_api_key(self):
+        bounce = PMBounceManager(api_key='test')
+        bounce.api_key = 'other'
+        self.assertEqual('other', bounce._get_headers()['X-Postmark-Server-Token'])
+
+    def test_get_single_not_found(self):
+        bounce = PMBounceManager(api_key='test')
+
+        with mock.patch('postmark.core._SESSION.request',
+            return_value=make_fake_response({'ErrorCode': 701, 'Message': 'Not found'}, 404)):
+            err = bounce.get_single(1)
+            self.assertIsInstance(err, HTTPError)
+            self.assertEqual(404, err.code)
+
+
+if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,327 @@
+import asyncio
+import json
+import unittest
+from io import StringIO
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        INSTALLED_APPS=[
+        ],
+        MIDDLEWARE_CLASSES=[],
+        EMAIL_BACKEND = 'postmark.django_backend.EmailBackend',
+        POSTMARK_API_KEY='dummy',
+    )
+    django.setup()
+
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives, EmailMessage
+from django.test import TestCase
+
+import mock
+
+from postmark.core import _SESSION
+from postmark.django_backend import EmailBackend
+
+from tests import AsyncPMMail, FAKE_SINGLE_OK, FakeResponse, async_core, make_fake_response
+
+
+class EmailBackendTests(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(_SESSION, 'post', return_value=FakeResponse(FAKE_SINGLE_OK))
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_send_multi_alternative_html_email(self):
+        # build a message and send it
+        message = EmailMultiAlternatives(
+            connection=EmailBackend(api_key='dummy'),
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='hello there'
+        )
+        message.attach_alternative('<b>hello</b> there', 'text/html')
+
+        message.send()
+        data = json.loads(self.mock_post.call_args[1]['data'].decode('utf-8'))
+        self.assertEqual('hello there', data['TextBody'])
+        self.assertEqual('<b>hello</b> there', data['HtmlBody'])
+
+    def test_send_content_subtype_email(self):
+        # build a message and send it
+        message = EmailMessage(
+            connection=EmailBackend(api_key='dummy'),
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+        )
+        message.content_subtype = 'html'
+
+        message.send()
+        data = json.loads(self.mock_post.call_args[1]['data'].decode('utf-8'))
+        self.assertEqual('<b>hello</b> there', data['HtmlBody'])
+        self.assertFalse('TextBody' in data)
+
+    def test_send_multi_alternative_with_subtype_html_email(self):
+        """
+        Client uses EmailMultiAlternative but instead of specifying a html alternative they insert html content
+        into the main message and specify message_subtype
+        :return:
+        """
+        message = EmailMultiAlternatives(
+            connection=EmailBackend(api_key='dummy'),
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+        )
+        # NO alternatives attached.  subtype specified instead
+        message.content_subtype = 'html'
+
+        message.send()
+        data = json.loads(self.mock_post.call_args[1]['data'].decode('utf-8'))
+        self.assertFalse('TextBody' in data)
+        self.assertEqual('<b>hello</b> there', data['HtmlBody'])
+
+    @unittest.skipIf(AsyncPMMail is None, 'httpx is not installed')
+    async def test_async_send_messages_batch(self):
+        message1 = EmailMessage(
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+        )
+        message2 = EmailMessage(
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+        )
+
+        with mock.patch('httpx.AsyncClient.post', new=mock.AsyncMock(return_value=make_fake_response([
+            {"ErrorCode": 0, "Message": "OK", "MessageID": "b7bc2f4a-e38e-4336-af7d-e6c392c2f817"},
+            {"ErrorCode": 0, "Message": "OK", "MessageID": "e2ecbbfc-fe12-463d-b933-9fe22915106d"},
+        ]))) as transport:
+            clients = []
+            new_client = async_core._new_client
+
+            def tracked_client():
+                clients.append(new_client())
+                return clients[-1]
+
+            with mock.patch('postmark.async_core._new_client', side_effect=tracked_client):
+                sent_messages = await EmailBackend(api_key='dummy').async_send_messages([message1, message2])
+            self.assertEqual(2, sent_messages)
+            self.assertEqual(1, transport.call_count)
+            self.assertTrue(transport.call_args[0][0].endswith('email/batch'))
+
+        # The backend's client is closed with the call, not kept per loop
+        self.assertEqual(1, len(clients))
+        self.assertTrue(clients[0].is_closed)
+        self.assertNotIn(asyncio.get_running_loop(), async_core._CLIENTS)
+
+    def test_send_messages_fail_silently(self):
+        self.mock_post.return_value = FakeResponse(b'{}', 500)
+        message = EmailMessage(
+            from_email='from@test.com', to=['recipient@test.com'], subject='test', body='hello there'
+        )
+        self.assertEqual(0, EmailBackend(api_key='dummy', fail_silently=True).send_messages([message]))
+
+    def test_message_count_single(self):
+        """Test backend returns count sending single message."""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
+            message = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+            
+            self.mock_post.return_value = make_fake_response(json.loads("""
+                {
+                  "To": "recipient@test.com",
+                  "SubmittedAt": "2014-02-17T07:25:01.4178645-05:00",
+                  "MessageID": "0a129aee-e1cd-480d-b08d-4f48548ff48d",
+                  "ErrorCode": 0,
+                  "Message": "OK"
+                }
+                """))
+            response = message.send()
+            self.assertEqual(response, 1)
+
+    def test_message_count_batch(self):
+        """Test backend returns count sending batch messages."""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
+
+            message1 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+            message2 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+
+            self.mock_post.return_value = make_fake_response(json.loads("""
+                [
+                  {
+                    "ErrorCode": 0,
+                    "Message": "OK",
+                    "MessageID": "b7bc2f4a-e38e-4336-af7d-e6c392c2f817",
+                    "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
+                    "To": "receiver1@example.com"
+                  },
+                  {
+                    "ErrorCode": 0,
+                    "Message": "OK",
+                    "MessageID": "e2ecbbfc-fe12-463d-b933-9fe22915106d",
+                    "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
+                    "To": "receiver2@example.com"
+                  }
+                ]
+                """))
+
+            # Directly send bulk mail via django
+            connection = mail.get_connection()
+            sent_messages = connection.send_messages([message1, message2])
+            self.assertEqual(sent_messages, 2)
+            self.assertEqual(self.mock_post.call_count, 1)
+            self.assertTrue(self.mock_post.call_args[0][0].endswith('email/batch'))
+
+    def test_message_count_batch_skips_missing_recipients(self):
+        """Test backend only counts messages that were part of the batch."""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
+            message1 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+            message2 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+            message3 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
+            )
+
+            self.mock_post.return_value = make_fake_response([
+                {"ErrorCode": 0, "Message": "OK", "MessageID": "b7bc2f4a-e38e-4336-af7d-e6c392c2f817"},
+                {"ErrorCode": 0, "Message": "OK", "MessageID": "e2ecbbfc-fe12-463d-b933-9fe22915106d"},
+            ])
+
+            connection = mail.get_connection()
+            sent_messages = connection.send_messages([message1, message2, message3])
+            self.assertEqual(sent_messages, 2)
+            self.assertEqual(len(json.loads(self.mock_post.call_args[1]['data'].decode('utf-8'))), 2)
+
+    def test_send_messages_nothing_to_send_single(self):
+        """Make sure no errors when send results in zero messages."""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
+            message1 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
+            )
+
+            # Directly send bulk mail via django
+            connection = mail.get_connection()
+            sent_messages = connection.send_messages([message1])
+            self.assertEqual(0, sent_messages)
+
+    def test_send_messages_nothing_to_send_double(self):
+        """Make sure no errors when send results in zero messages."""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=False):
+            message1 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
+            )
+
+            message2 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=[], subject='html test', body='<b>hello</b> there'
+            )
+
+            # Directly send bulk mail via django
+            connection = mail.get_connection()
+            sent_messages = connection.send_messages([message1, message2])
+            self.assertEqual(0, sent_messages)
+
+    def test_message_id_single(self):
+        """Test backend returns message sending single message with setting True"""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=True):
+            message = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+            
+            self.mock_post.return_value = make_fake_response(json.loads("""
+                {
+                  "To": "recipient@test.com",
+                  "SubmittedAt": "2014-02-17T07:25:01.4178645-05:00",
+                  "MessageID": "0a129aee-e1cd-480d-b08d-4f48548ff48d",
+                  "ErrorCode": 0,
+                  "Message": "OK"
+                }
+                """))
+            message_ids = message.send()
+            self.assertEqual(message_ids[0], "0a129aee-e1cd-480d-b08d-4f48548ff48d")
+
+    def test_message_id_batch(self):
+        """Test backend returns message sending batch messages with setting True"""
+        with self.settings(POSTMARK_RETURN_MESSAGE_ID=True):
+
+            message1 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+            message2 = EmailMessage(
+                connection=EmailBackend(api_key='dummy'),
+                from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='<b>hello</b> there'
+            )
+
+            self.mock_post.return_value = make_fake_response(json.loads("""
+                [
+                  {
+                    "ErrorCode": 0,
+                    "Message": "OK",
+                    "MessageID": "b7bc2f4a-e38e-4336-af7d-e6c392c2f817",
+                    "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
+                    "To": "receiver1@example.com"
+                  },
+                  {
+                    "ErrorCode": 0,
+                    "Message": "OK",
+                    "MessageID": "e2ecbbfc-fe12-463d-b933-9fe22915106d",
+                    "SubmittedAt": "2010-11-26T12:01:05.1794748-05:00",
+                    "To": "receiver2@example.com"
+                  }
+                ]
+                """))
+
+            # Directly send bulk mail via django
+            connection = mail.get_connection()
+            sent_messages = connection.send_messages([message1, message2])
+            self.assertIn('b7bc2f4a-e38e-4336-af7d-e6c392c2f817', sent_messages)
+            self.assertIn('e2ecbbfc-fe12-463d-b933-9fe22915106d', sent_messages)
+
+    def test_send_attachment_bytes(self):
+        message = EmailMultiAlternatives(
+            connection=EmailBackend(api_key='dummy'),
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='hello there'
+        )
+
+        f = StringIO(u'1,2,3')
+        message.attach('filename.csv', f.read(), 'text/csv')
+
+        message.send()
+
+    def test_message_stream(self):
+        message = EmailMultiAlternatives(
+            connection=EmailBackend(api_key='dummy'),
+            from_email='from@test.com', to=['recipient@test.com'], subject='html test', body='hello there'
+        )
+        message.attach_alternative('<b>hello</b> there', 'text/html')
+        message.message_stream = 'broadcast'
+
+        message.send()
+        data = json.loads(self.mock_post.call_args[1]['data'].decode('utf-8'))
+        self.assertEqual('broadcast', data['MessageStream'])
+        self.assertEqual('hello there', data['TextBody'])
+        self.assertEqual('<b>hello</b> there', data['HtmlBody'])
+
+
+if __name__ == '__main__':
+    unittest.main()